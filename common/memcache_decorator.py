@@ -36,14 +36,17 @@ def DefaultCreateKey(func, prefix, args, kwargs=None):
   """
   module = func.__module__ or 'None'
   key = prefix or module + '.' + func.__name__
+  # The binary pickle protocol produces smaller output with less CPU than the
+  # default ASCII protocol; the bytes only feed the md5 below, so the exact
+  # encoding is otherwise irrelevant.
   if args:
     for arg in args:
       try:
-        key += pickle.dumps(arg)
+        key += pickle.dumps(arg, pickle.HIGHEST_PROTOCOL)
       except pickle.PicklingError:
         key += _ToShortStr(arg)
   if kwargs:
-    key += pickle.dumps(kwargs)
+    key += pickle.dumps(kwargs, pickle.HIGHEST_PROTOCOL)
   return hashlib.md5(key).hexdigest()
 
 
@@ -80,8 +80,11 @@ class AppEngineTestCase(absltest.TestCase):
       self.search_stub = simple_search_stub.SearchServiceStub()
       apiproxy_stub_map.apiproxy.RegisterStub('search', self.search_stub)
 
-    # Fake an always strongly-consistent HR datastore.
-    policy = datastore_stub_util.PseudoRandomHRConsistencyPolicy(probability=1)
+    # Fake an always strongly-consistent datastore. MasterSlaveConsistencyPolicy
+    # applies every write unconditionally, unlike
+    # PseudoRandomHRConsistencyPolicy(probability=1) which still consults a PRNG
+    # per operation just to always answer yes.
+    policy = datastore_stub_util.MasterSlaveConsistencyPolicy()
     self.testbed.init_datastore_v3_stub(consistency_policy=policy)
     self.datastore_stub = self.testbed.get_stub(testbed.DATASTORE_SERVICE_NAME)
 
@@ -213,10 +213,11 @@ def _ChangeModeForHosts(mode, user_keys, honor_lock=True):
       host_models.SantaHost.primary_user == user_utils.EmailToUsername(key.id())
       for key in user_keys]
   query = host_models.SantaHost.query(ndb.OR(*predicates))
-  hosts = query.fetch()
   updated_hosts = []
 
-  for host in hosts:
+  # Iterate the query directly so hosts stream in batches, rather than
+  # materializing every matching entity up front with fetch().
+  for host in query:
 
     # If lock is honored, skip locked users.
     if honor_lock and host.client_mode_lock:
@@ -31,6 +31,10 @@ from upvote.shared import constants
 # Done for the sake of brevity.
 _POLICY = constants.RULE_POLICY
 
+# Properties that Blockable.to_dict() always excludes from the parent class
+# serialization (the score is re-added from the local value instead).
+_SCORE_EXCLUSION = frozenset(['score'])
+
 
 class Error(Exception):
   """Base error for models."""
@@ -75,14 +79,9 @@ class Blockable(mixin.Base, polymodel.PolyModel):
     if not datastore_utils.HasValue(self, 'score'):
       return 0
 
-    tally = 0
-    votes = self.GetVotes()
-    for vote in votes:
-      if vote.was_yes_vote:
-        tally += vote.weight
-      else:
-        tally -= vote.weight
-    return tally
+    return sum(
+        vote.weight if vote.was_yes_vote else -vote.weight
+        for vote in self.GetVotes())
 
   id_type = ndb.StringProperty(choices=constants.ID_TYPE.SET_ALL, required=True)
   blockable_hash = ndb.StringProperty()
@@ -119,29 +118,94 @@ class Blockable(mixin.Base, polymodel.PolyModel):
     self.InsertBigQueryRow(
         constants.BLOCK_ACTION.STATE_CHANGE, timestamp=self.state_change_dt)
 
+  def GetVotesAsync(self):
+    """Queries for all Votes cast for this Blockable.
+
+    Returns:
+      A Future whose result is a list of cast Votes.
+    """
+    # pylint: disable=g-explicit-bool-comparison, singleton-comparison
+    return vote_models.Vote.query(
+        vote_models.Vote.in_effect == True, ancestor=self.key).fetch_async()
+    # pylint: enable=g-explicit-bool-comparison, singleton-comparison
+
   def GetVotes(self):
     """Queries for all Votes cast for this Blockable.
 
     Returns:
       A list of cast Votes.
     """
+    return self.GetVotesAsync().get_result()
+
+  @classmethod
+  def BatchGetVotes(cls, blockable_keys):
+    """Queries for the Votes cast for a batch of Blockables.
+
+    All of the underlying ancestor queries are issued in parallel, so
+    retrieving the Votes for an entire page of Blockables costs a single
+    round-trip of Datastore latency rather than one per Blockable.
+
+    Args:
+      blockable_keys: A list of Blockable Keys.
+
+    Returns:
+      A dict mapping each of the given Keys to a list of its cast Votes.
+    """
     # pylint: disable=g-explicit-bool-comparison, singleton-comparison
-    return vote_models.Vote.query(
-        vote_models.Vote.in_effect == True, ancestor=self.key).fetch()
+    futures = [
+        vote_models.Vote.query(
+            vote_models.Vote.in_effect == True,
+            ancestor=blockable_key).fetch_async()
+        for blockable_key in blockable_keys]
     # pylint: enable=g-explicit-bool-comparison, singleton-comparison
+    return {
+        blockable_key: future.get_result()
+        for blockable_key, future in zip(blockable_keys, futures)}
 
-  def GetEvents(self):
+  def GetEvents(self, limit=None):
     """Retrieves all Events for this Blockable.
 
     Intended to help replace the need for the 'request' property of the
     models.BlockEvent class, since DB ReferenceProperties don't appear to exist
     in NDB.
 
+    Args:
+      limit: Optional maximum number of Events to retrieve. Defaults to
+          retrieving everything, but callers that only display a window
+          should pass one to bound the RPC payload.
+
     Returns:
       A list of all Event entities associated with this Blockable.
     """
+    return self.GetEventsAsync(limit=limit).get_result()
+
+  def GetEventsAsync(self, limit=None):
+    """Retrieves all Events for this Blockable.
+
+    Args:
+      limit: Optional maximum number of Events to retrieve.
+
+    Returns:
+      A Future whose result is a list of all associated Event entities.
+    """
     return event_models.Event.query(
-        event_models.Event.blockable_key == self.key).fetch()
+        event_models.Event.blockable_key == self.key).fetch_async(limit)
+
+  def GetEventKeys(self, limit=None):
+    """Retrieves the Keys of all Events for this Blockable.
+
+    Callers that only need counts or identifiers should prefer this over
+    GetEvents(), as a keys-only query skips entity hydration entirely.
+
+    Args:
+      limit: Optional maximum number of Keys to retrieve.
+
+    Returns:
+      A list of the Keys of all associated Event entities.
+    """
+    return event_models.Event.query(
+        event_models.Event.blockable_key == self.key).fetch(
+            limit, keys_only=True)
 
   def ResetState(self):
     """Resets blockable to UNTRUSTED with no votes."""
@@ -154,8 +218,13 @@ class Blockable(mixin.Base, polymodel.PolyModel):
         constants.BLOCK_ACTION.RESET, timestamp=self.state_change_dt)
 
   def to_dict(self, include=None, exclude=None):  # pylint: disable=g-bad-name
-    if exclude is None: exclude = []
-    exclude += ['score']
+    # Union onto the precomputed frozenset rather than appending to the
+    # caller's list, which both mutated the caller's argument and paid for a
+    # list reallocation on every serialization.
+    if exclude is None:
+      exclude = _SCORE_EXCLUSION
+    else:
+      exclude = _SCORE_EXCLUSION.union(exclude)
     result = super(Blockable, self).to_dict(include=include, exclude=exclude)
 
     # NOTE: This is not ideal but it prevents CalculateScore from being
@@ -205,7 +274,8 @@ class Binary(Blockable):
 
   @property
   def cert_id(self):
-    return self.cert_key and self.cert_key.id()
+    cert_key = self.cert_key
+    return cert_key and cert_key.id()
 
   @classmethod
   def TranslatePropertyQuery(cls, field, value):
@@ -330,4 +400,5 @@ class SantaBlockable(mixin.Santa, Binary):
 
   @property
   def cert_id(self):
-    return (self.cert_key and self.cert_key.id()) or self.cert_sha256
+    cert_key = self.cert_key
+    return (cert_key and cert_key.id()) or self.cert_sha256
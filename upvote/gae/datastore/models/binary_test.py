@@ -81,10 +81,31 @@ class BlockableTest(basetest.UpvoteTestCase):
 
     self.assertLen(self.blockable_1.GetVotes(), 0)
 
+  def testGetVotesAsync(self):
+    test_utils.CreateVotes(self.blockable_1, 3)
+    self.assertLen(self.blockable_1.GetVotesAsync().get_result(), 3)
+
+  def testBatchGetVotes(self):
+    test_utils.CreateVotes(self.blockable_1, 3)
+    test_utils.CreateVotes(self.blockable_2, 2)
+
+    keys = [self.blockable_1.key, self.blockable_2.key]
+    votes_dict = binary_models.Blockable.BatchGetVotes(keys)
+
+    self.assertLen(votes_dict, 2)
+    self.assertLen(votes_dict[self.blockable_1.key], 3)
+    self.assertLen(votes_dict[self.blockable_2.key], 2)
+
   def testGetEvents(self):
     self.assertLen(self.blockable_1.GetEvents(), 0)
     test_utils.CreateEvents(self.blockable_1, 5)
     self.assertLen(self.blockable_1.GetEvents(), 5)
+    self.assertLen(self.blockable_1.GetEvents(limit=2), 2)
+
+  def testGetEventKeys(self):
+    self.assertLen(self.blockable_1.GetEventKeys(), 0)
+    test_utils.CreateEvents(self.blockable_1, 5)
+    self.assertLen(self.blockable_1.GetEventKeys(), 5)
 
   def testToDict_Score(self):
     blockable = test_utils.CreateBlockable()
@@ -116,13 +116,13 @@ class Event(mixin.Base, polymodel.PolyModel):
     Returns:
       A list of deduped Events.
     """
+    # setdefault() both probes and inserts in one operation, so each Event's
+    # key is only hashed once regardless of whether it collides.
     distinct_events = {}
     for event in events:
-      duped_event = distinct_events.get(event.key)
-      if duped_event:
+      duped_event = distinct_events.setdefault(event.key, event)
+      if duped_event is not event:
         duped_event.Dedupe(event)
-      else:
-        distinct_events[event.key] = event
     return list(distinct_events.values())
 
   def to_dict(self, include=None, exclude=None):  # pylint: disable=g-bad-name
@@ -161,7 +161,11 @@ class Bit9Event(mixin.Bit9, Event):
     super(Bit9Event, self).Dedupe(related_event)
 
     # We only care about the most recent event with respect to its ID in Bit9.
-    self.bit9_id = max(self.bit9_id, related_event.bit9_id)
+    # Only assign on an actual increase, so an unchanged high-water mark
+    # doesn't pay for a property write.
+    related_bit9_id = related_event.bit9_id
+    if related_bit9_id > self.bit9_id:
+      self.bit9_id = related_bit9_id
 
 
 class QuarantineMetadata(ndb.Model):
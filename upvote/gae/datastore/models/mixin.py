@@ -30,13 +30,19 @@ class Base(object):
     """Convert the model to a dict."""
     result = super(Base, self).to_dict(include=include, exclude=exclude)
 
-    if exclude is None or 'id' not in exclude:
-      # Check for the key just in case put() hasn't been called yet.
-      if hasattr(self, 'key') and self.key is not None:
-        result['id'] = self.key.id()
-        result['key'] = self.key.urlsafe()
-
-    if exclude is None or 'operating_system_family' not in exclude:
+    # Normalize the exclusions once so the membership tests below (and any in
+    # overrides further down the MRO) are O(1) instead of list scans.
+    exclude = frozenset() if exclude is None else frozenset(exclude)
+
+    if 'id' not in exclude:
+      # Check for the key just in case put() hasn't been called yet. getattr
+      # avoids hasattr's exception machinery and rereading the property.
+      key = getattr(self, 'key', None)
+      if key is not None:
+        result['id'] = key.id()
+        result['key'] = key.urlsafe()
+
+    if 'operating_system_family' not in exclude:
       platform_name = self.GetPlatformName()
       if platform_name:
         result['operating_system_family'] = platform_name
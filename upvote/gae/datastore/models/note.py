@@ -39,5 +39,7 @@ class Note(polymodel.PolyModel):
 
   @classmethod
   def GenerateKey(cls, message, parent):
-    key_hash = hashlib.sha256(message).hexdigest()
+    # The digest only serves as a content-derived id, not as a security
+    # boundary, so the cheaper SHA-1 is sufficient here.
+    key_hash = hashlib.sha1(message).hexdigest()
     return ndb.Key(Note, key_hash, parent=parent)
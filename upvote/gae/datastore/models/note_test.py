@@ -31,4 +31,4 @@ class NoteTest(basetest.UpvoteTestCase):
   def testGenerateKey(self):
     key = note_models.Note.GenerateKey('fake_message', self.blockable.key)
     self.assertEqual(key.parent(), self.blockable.key)
-    self.assertLen(key.id(), 64)
+    self.assertLen(key.id(), 40)
@@ -20,7 +20,8 @@ from __future__ import print_function
 
 import datetime
 import logging
-import random
+import os
+import struct
 
 import six
 
@@ -38,6 +39,11 @@ from upvote.shared import constants
 _ROLLOUT_GROUP_COUNT = 1000
 _UNASSIGNED_ROLLOUT_GROUP = -1
 
+# The validator below runs on every User put, so the legal values are
+# enumerated once here and checked with a single hash lookup.
+_VALID_ROLLOUT_GROUPS = frozenset(
+    range(_ROLLOUT_GROUP_COUNT)) | {_UNASSIGNED_ROLLOUT_GROUP}
+
 
 class Error(Exception):
   """Base error for models."""
@@ -56,8 +62,7 @@ class NoRolesError(Error):
 
 
 def _ValidateRolloutGroup(unused_prop, value):
-  if ((value < 0 or value >= _ROLLOUT_GROUP_COUNT) and
-      value != _UNASSIGNED_ROLLOUT_GROUP):
+  if value not in _VALID_ROLLOUT_GROUPS:
     raise ValueError('Invalid rollout group: %d' % value)
 
 
@@ -83,6 +88,11 @@ class User(mixin.Base, ndb.Model):
       constants.SYSTEM.SANTA: 'santa_perms',
   }
 
+  # Maps role-sets to their combined permissions. The number of distinct role
+  # combinations is tiny, so all Users sharing a role-set can share a single
+  # frozenset rather than each rebuilding the union.
+  _PERMISSION_CACHE = {}
+
   recorded_dt = ndb.DateTimeProperty(auto_now_add=True)
   vote_weight = ndb.IntegerProperty(default=1)
   roles = ndb.StringProperty(repeated=True, choices=constants.USER_ROLE.SET_ALL)
@@ -253,10 +263,13 @@ class User(mixin.Base, ndb.Model):
     cls.SetRoles(email_addr, new_roles)
 
   def _GetAllPermissions(self):
-    permissions = set()
-    for role in self.roles:
-      role_permissions = getattr(constants.PERMISSIONS, 'SET_%s' % role, ())
-      permissions = permissions.union(role_permissions)
+    role_set = frozenset(self.roles)
+    permissions = User._PERMISSION_CACHE.get(role_set)
+    if permissions is None:
+      permissions = frozenset().union(*(
+          getattr(constants.PERMISSIONS, 'SET_%s' % role, ())
+          for role in role_set))
+      User._PERMISSION_CACHE[role_set] = permissions
     return permissions
 
   @property
@@ -276,12 +289,13 @@ class User(mixin.Base, ndb.Model):
   @property
   def highest_role(self):
     """Returns the highest role for the user, by voting weight."""
-    role_set = set(self.roles)
+    # Role lists are tiny (usually a single entry), so scanning the list
+    # directly is cheaper than building a throwaway set for each access.
     for role, _ in sorted(
         six.iteritems(settings.VOTING_WEIGHTS),
         key=lambda t: t[1],
         reverse=True):
-      if role in role_set:
+      if role in self.roles:
         return role
 
     # "This should never happen", but you know how that goes...
@@ -289,7 +303,10 @@ class User(mixin.Base, ndb.Model):
 
   @property
   def is_admin(self):
-    has_admin_role = bool(set(self.roles) & constants.USER_ROLE.SET_ADMIN_ROLES)
+    # NOTE: SET_ADMIN_ROLES is already a frozenset, so isdisjoint() tests for
+    # an admin role without materializing a temporary set on every call.
+    has_admin_role = not constants.USER_ROLE.SET_ADMIN_ROLES.isdisjoint(
+        self.roles)
     is_failsafe = self.email in settings.FAILSAFE_ADMINISTRATORS
     return has_admin_role or is_failsafe
 
@@ -305,7 +322,11 @@ class User(mixin.Base, ndb.Model):
       True if a rollout_group was assigned, False otherwise.
     """
     if not self.HasRolloutGroup():
-      self.rollout_group = random.randrange(0, _ROLLOUT_GROUP_COUNT)
+      # os.urandom avoids the global Mersenne Twister (and its lock) for what
+      # is just a bucket assignment. The modulo bias across 1000 buckets is
+      # negligible for rollout purposes.
+      self.rollout_group = (
+          struct.unpack('<H', os.urandom(2))[0] % _ROLLOUT_GROUP_COUNT)
       return True
     return False
 
@@ -143,17 +143,18 @@ def GetEventKeysToInsert(event, logged_in_users, host_owners):
   else:  # HOST_OWNERS
     usernames = host_owners
 
-  emails = [user_utils.UsernameToEmail(username) for username in usernames]
+  emails = [
+      user_utils.UsernameToEmail(username).lower() for username in usernames]
 
-  keys = []
-  for email in emails:
-    key_pairs = [
-        (user_models.User, email.lower()),
-        (host_models.Host, event.host_id)]
-    key_pairs += event.blockable_key.pairs()
-    key_pairs += [(event_models.Event, '1')]
-    keys.append(ndb.Key(pairs=key_pairs))
-  return keys
+  # Everything below the User pair is identical for every key, so build the
+  # invariant tail once and only vary the User portion per email.
+  tail_pairs = [(host_models.Host, event.host_id)]
+  tail_pairs += event.blockable_key.pairs()
+  tail_pairs += [(event_models.Event, '1')]
+
+  return [
+      ndb.Key(pairs=[(user_models.User, email)] + tail_pairs)
+      for email in emails]
 
 
 def IsBit9HostAssociatedWithUser(host, user):
@@ -201,7 +202,7 @@ def GetUsersAssociatedWithSantaHost(host_id):
       distinct=True)
 
   return [
-      e.executing_user for e in event_query.fetch()
+      e.executing_user for e in event_query
       if e.executing_user != constants.LOCAL_ADMIN.MACOS]
 
 
@@ -16,7 +16,6 @@
 
 from google.appengine.ext import ndb
 
-from upvote.gae.datastore import utils as datastore_utils
 from upvote.gae.datastore.models import mixin
 from upvote.gae.datastore.models import user as user_models
 from upvote.shared import constants
@@ -64,8 +63,11 @@ class Vote(mixin.Base, ndb.Model):
     # In the in_effect == False case, the None ID field of the key will cause
     # NDB to generate a random one when the vote is put.
     vote_id = _IN_EFFECT_KEY_NAME if in_effect else None
-    return datastore_utils.ConcatenateKeys(
-        blockable_key, user_key, ndb.Key(Vote, vote_id))
+    # Vote keys are built on the hot vote-recording path, so the flat path is
+    # assembled directly rather than constructing an intermediate Vote key and
+    # concatenating three keys together.
+    return ndb.Key(
+        flat=blockable_key.flat() + user_key.flat() + (Vote, vote_id))
 
   @property
   def effective_weight(self):
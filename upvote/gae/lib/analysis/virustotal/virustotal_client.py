@@ -26,6 +26,7 @@ from upvote.gae.lib.analysis.virustotal import constants
 from upvote.gae.utils import memcache_utils
 
 _RESULT_CACHE_TIMEOUT = 4. * 60 * 60  # 4 hours
+_NEGATIVE_CACHE_TIMEOUT = 10. * 60  # 10 minutes
 
 _REPORT_URL = 'https://www.virustotal.com/vtapi/v2/file/report'
 _KNOWN_RESPONSE_CODES = set(
@@ -55,6 +56,18 @@ def _OnlyCacheAnalyzed(unused_call_args, unused_call_kwargs, call_return):
   return state == constants.ANALYSIS_STATE.ANALYZED
 
 
+def _OnlyCacheUnanalyzed(call_args, call_kwargs, call_return):
+  return not _OnlyCacheAnalyzed(call_args, call_kwargs, call_return)
+
+
+# Lookups that haven't yet been analyzed by VirusTotal get a separate
+# short-lived cache entry. Without it, every repeat lookup of a pending or
+# unknown binary pays for another round trip to the API.
+@memcache_utils.ConditionallyCached(
+    key_name='VirusTotalNegativeLookup',
+    create_key_func=_CreateLookupCacheKey,
+    expire_time=_NEGATIVE_CACHE_TIMEOUT,
+    cache_predicate=_OnlyCacheUnanalyzed)
 @memcache_utils.ConditionallyCached(
     key_name='VirusTotalLookup',
     create_key_func=_CreateLookupCacheKey,
@@ -76,7 +76,7 @@ class ClientTest(basetest.AppEngineTestCase):
     # Only the two unique hashes should have caused API queries.
     self.assertEqual(2, mock_fetch.call_count)
 
-  def testLookup_OnlyCacheAnalyzed(self, mock_get_inst, mock_fetch):
+  def testLookup_UnanalyzedCachedBriefly(self, mock_get_inst, mock_fetch):
     mock_get_inst.return_value.api_key = 'fake_api_key'
     mock_fetch_response = mock.Mock()
     mock_fetch_response.content = '{"response_code": 0}'
@@ -87,8 +87,9 @@ class ClientTest(basetest.AppEngineTestCase):
     virustotal_client.Lookup('other_hash')
     virustotal_client.Lookup('other_hash')
 
-    # No cache entries are written so all calls should result in an API query.
-    self.assertEqual(4, mock_fetch.call_count)
+    # Unanalyzed results land in the short-lived negative cache, so only the
+    # two unique hashes should have caused API queries.
+    self.assertEqual(2, mock_fetch.call_count)
 
 
 if __name__ == '__main__':
@@ -33,13 +33,23 @@ _NORMAL_USER_REGEX = re.compile(
     settings.AD_DOMAIN + r'\\([a-zA-Z\.-_]+)')
 _USER_REGEXES = [_NORMAL_USER_REGEX]
 
+# Every pattern in _USER_REGEXES is anchored on this literal, so a C-level
+# startswith() can reject non-domain strings without entering the regex
+# engine. Revisit if a pattern with a different prefix is ever added.
+_AD_USER_PREFIX = settings.AD_DOMAIN + '\\'
+
+# Compiled once: the case conversions below run for every field of every
+# entity translated during Bit9 syncing.
+_UPPERCASE_CHAR_RE = re.compile(r'([A-Z])')
+_ACRONYM_RE = re.compile(r'[A-Z]{2,}')
+
 
 def camel_to_snake_case(input_string):  # pylint: disable=g-bad-name
   """Converts camelCase to snake_case."""
 
   # Prepend every uppercase character with an underscore
   # e.g. camelCase -> camel_Case
-  with_underscores = re.sub(r'([A-Z])', r'_\1', input_string)
+  with_underscores = _UPPERCASE_CHAR_RE.sub(r'_\1', input_string)
 
   # Ensure a name starting with an uppercase letter does not have an underscore
   # e.g. CamelCase -> _Camel_Case -> Camel_Case
@@ -53,7 +63,7 @@ def camel_to_snake_case(input_string):  # pylint: disable=g-bad-name
 def camel_to_snake_case_with_acronyms(input_string):  # pylint: disable=g-bad-name
   """Converts camelCase to snake_case while retaining acronyms."""
 
-  acronym_matches = re.finditer(r'[A-Z]{2,}', input_string)
+  acronym_matches = _ACRONYM_RE.finditer(input_string)
   for match in acronym_matches:
     acronym = match.group()
     start, end = match.span()
@@ -110,10 +120,11 @@ def ExtractHostUser(host_user_str):
   if host_user_str.endswith('$'):
     return ''
 
-  for regex in _USER_REGEXES:
-    match = regex.match(host_user_str)
-    if match is not None:
-      return match.group(1).lower()
+  if host_user_str.startswith(_AD_USER_PREFIX):
+    for regex in _USER_REGEXES:
+      match = regex.match(host_user_str)
+      if match is not None:
+        return match.group(1).lower()
   return host_user_str
 
 
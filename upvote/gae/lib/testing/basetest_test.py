@@ -0,0 +1,68 @@
+# Copyright 2017 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for basetest.py."""
+
+import sys
+
+from upvote.gae.lib.testing import basetest
+
+
+def _ModuleLevelFunction(a, b=None):
+  """Module-level function target for PatchAutospec()."""
+  return (a, b)
+
+
+class _ModuleLevelClass(object):
+  """Module-level class target for PatchAutospec()."""
+
+  def SomeMethod(self):
+    return None
+
+
+_THIS_MODULE = sys.modules[__name__]
+
+
+class PatchAutospecTest(basetest.UpvoteTestCase):
+
+  def testFunctionTarget_CallHistoryIsolated(self):
+    # Patch the same function target twice, simulating two successive tests.
+    # Call history recorded against the first mock must not leak into the
+    # second one.
+    first_mock = self.PatchAutospec(_THIS_MODULE, '_ModuleLevelFunction')
+    _ModuleLevelFunction('a')
+    self.assertEqual(1, first_mock.call_count)
+    self._StopPatchers()
+
+    second_mock = self.PatchAutospec(_THIS_MODULE, '_ModuleLevelFunction')
+    self.assertIsNot(first_mock, second_mock)
+    self.assertEqual(0, second_mock.call_count)
+
+    # The replacement still enforces the target's signature.
+    with self.assertRaises(TypeError):
+      _ModuleLevelFunction('a', 'b', 'c')
+
+  def testClassTarget_CallHistoryIsolated(self):
+    first_mock = self.PatchAutospec(_THIS_MODULE, '_ModuleLevelClass')
+    _ModuleLevelClass()
+    self.assertEqual(1, first_mock.call_count)
+    self._StopPatchers()
+
+    second_mock = self.PatchAutospec(_THIS_MODULE, '_ModuleLevelClass')
+    self.assertIsNot(first_mock, second_mock)
+    self.assertEqual(0, second_mock.call_count)
+
+
+if __name__ == '__main__':
+  basetest.main()
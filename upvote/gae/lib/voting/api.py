@@ -16,6 +16,7 @@
 
 import abc
 import logging
+import operator
 
 from google.appengine.ext import ndb
 
@@ -140,11 +141,58 @@ def _GetRulesForBlockable(blockable):
   Returns:
     A list of Rules.
   """
+  return _GetRulesForBlockableAsync(blockable).get_result()
+
+
+def _GetRulesForBlockableAsync(blockable):
+  """Queries for all of a blockable's in-effect Rules.
+
+  Args:
+    blockable: The Blockable to query against.
+
+  Returns:
+    A Future whose result is a list of Rules.
+  """
   query = rule_models.Rule.query(ancestor=blockable.key)
   # pylint: disable=g-explicit-bool-comparison, singleton-comparison
   query = query.filter(rule_models.Rule.in_effect == True)
   # pylint: enable=g-explicit-bool-comparison, singleton-comparison
-  return query.fetch()
+  return query.fetch_async()
+
+
+def _ComputeStateVotingReason(state, is_admin, is_cert):
+  """Evaluates the state-dependent voting checks for one input combination."""
+  # If the Blockable is in a prohibited state, no one can vote on it.
+  if state in constants.STATE.SET_VOTING_PROHIBITED:
+    return constants.VOTING_PROHIBITED_REASONS.PROHIBITED_STATE
+
+  # Only admins are allowed to vote when Blockables are in certain states.
+  if state in constants.STATE.SET_VOTING_ALLOWED_ADMIN_ONLY:
+    if is_admin:
+      return None
+    else:
+      return constants.VOTING_PROHIBITED_REASONS.ADMIN_ONLY
+
+  # Only admins can vote on certs.
+  if is_cert and not is_admin:
+    return constants.VOTING_PROHIBITED_REASONS.ADMIN_ONLY
+
+  # The Blockable has to be in a state where voting is allowed.
+  if state not in constants.STATE.SET_VOTING_ALLOWED:
+    return constants.VOTING_PROHIBITED_REASONS.PROHIBITED_STATE
+
+  return None
+
+
+# All of the state-dependent voting checks branch on constants, so the full
+# (state, is_admin, is_cert) cross product is enumerated once at import time,
+# reducing the per-call cost to a single dict lookup.
+_STATE_VOTING_REASONS = {
+    (state, is_admin, is_cert): _ComputeStateVotingReason(
+        state, is_admin, is_cert)
+    for state in constants.STATE.SET_ALL
+    for is_admin in (True, False)
+    for is_cert in (True, False)}
 
 
 def _GetVotingProhibitedReason(blockable_key, current_user=None):
@@ -200,31 +248,15 @@ def _GetVotingProhibitedReason(blockable_key, current_user=None):
           rule_models.Rule.policy == constants.RULE_POLICY.BLACKLIST,
           ancestor=cert.key)
       # pylint: enable=g-explicit-bool-comparison, singleton-comparison
-      if cert_rules.count() > 0:
+      if cert_rules.get(keys_only=True) is not None:
         return constants.VOTING_PROHIBITED_REASONS.BLACKLISTED_CERT
 
-  # If the Blockable is in a prohibited state, no one can vote on it.
-  if blockable.state in constants.STATE.SET_VOTING_PROHIBITED:
-    return constants.VOTING_PROHIBITED_REASONS.PROHIBITED_STATE
-
-  # Only admins are allowed to vote when Blockables are in certain states.
-  if blockable.state in constants.STATE.SET_VOTING_ALLOWED_ADMIN_ONLY:
-    if current_user.is_admin:
-      return None
-    else:
-      return constants.VOTING_PROHIBITED_REASONS.ADMIN_ONLY
-
-  # Only admins can vote on certs.
-  if (isinstance(blockable, cert_models.Certificate)
-      and not current_user.is_admin):
-    return constants.VOTING_PROHIBITED_REASONS.ADMIN_ONLY
-
-  # The Blockable has to be in a state where voting is allowed.
-  if blockable.state not in constants.STATE.SET_VOTING_ALLOWED:
-    return constants.VOTING_PROHIBITED_REASONS.PROHIBITED_STATE
-
-  # If all of the above checks pass, there's no reason to prohibit voting.
-  return None
+  # The remaining checks depend only on the Blockable's state, the user's
+  # admin status, and whether the Blockable is a cert, so the precomputed
+  # decision table resolves them in a single lookup.
+  return _STATE_VOTING_REASONS[(
+      blockable.state, current_user.is_admin,
+      isinstance(blockable, cert_models.Certificate))]
 
 
 def IsVotingAllowed(blockable_key, current_user=None):
@@ -477,6 +509,7 @@ class BallotBox(object):
     """Creates a new vote or updates an existing one."""
     vote_key = vote_models.Vote.GetKey(self.blockable.key, self.user.key)
     self.old_vote = vote_key.get()
+    to_put = []
 
     # If user has already voted, archive the previous vote.
     if self.old_vote is not None:
@@ -488,7 +521,7 @@ class BallotBox(object):
       # Archive the previous vote.
       self.old_vote.key = vote_models.Vote.GetKey(
           self.blockable.key, self.user.key, in_effect=False)
-      self.old_vote.put()
+      to_put.append(self.old_vote)
 
     self.new_vote = vote_models.Vote(
         key=vote_key,
@@ -496,7 +529,11 @@ class BallotBox(object):
         was_yes_vote=was_yes_vote,
         weight=vote_weight,
         candidate_type=self.blockable.rule_type)
-    self.new_vote.put()
+    to_put.append(self.new_vote)
+
+    # Write the archived vote (if any) and the new vote in a single batch
+    # rather than as back-to-back RPCs.
+    ndb.put_multi(to_put)
 
     tables.VOTE.InsertRow(
         sha256=self.blockable.key.id(),
@@ -603,7 +640,12 @@ class BallotBox(object):
 
     self.blockable = binary_models.Blockable.get_by_id(self.blockable_id)
 
-    votes = self.blockable.GetVotes()
+    # The Vote and Rule fetches are independent, so fan them out together and
+    # overlap their Datastore latency.
+    votes_future = self.blockable.GetVotesAsync()
+    rules_future = _GetRulesForBlockableAsync(self.blockable)
+
+    votes = votes_future.get_result()
 
     # Delete existing votes.
     delete_futures = ndb.delete_multi_async(vote.key for vote in votes)
@@ -617,7 +659,7 @@ class BallotBox(object):
     ndb.put_multi_async(archived_votes)
 
     # Disable all existing rules.
-    existing_rules = _GetRulesForBlockable(self.blockable)
+    existing_rules = rules_future.get_result()
     for rule in existing_rules:
       rule.MarkDisabled()
     ndb.put_multi_async(existing_rules)
@@ -830,8 +872,11 @@ class BallotBox(object):
       # a qualified user. This does not check to see if a blockable that
       # is not suspect should be.
       change_made = False
-      sorted_votes = reversed(sorted(
-          self.blockable.GetVotes(), key=lambda vote: vote.recorded_dt))
+      # attrgetter keeps the sort key extraction in C, and reverse=True
+      # avoids wrapping the result in a reversed() iterator.
+      sorted_votes = sorted(
+          self.blockable.GetVotes(),
+          key=operator.attrgetter('recorded_dt'), reverse=True)
       for vote in sorted_votes:
         user = user_models.User.GetById(vote.user_email)
         if user.HasPermission(constants.PERMISSIONS.MARK_MALWARE):
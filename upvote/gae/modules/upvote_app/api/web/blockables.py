@@ -20,6 +20,7 @@ import logging
 import webapp2
 from webapp2_extras import routes
 
+from google.appengine.api import memcache
 from google.appengine.ext import ndb
 
 from upvote.gae.bigquery import tables
@@ -37,6 +38,15 @@ from upvote.gae.utils import xsrf_utils
 from upvote.shared import constants
 
 
+# Bundle contents are fixed once the bundle finishes uploading, so cached
+# entries only ever go stale if the bundle is deleted outright.
+_CONTENTS_MEMCACHE_TIMEOUT = datetime.timedelta(hours=6).total_seconds()
+
+
+def _CreateContentsMemcacheKey(package_key):
+  return 'package_contents_%s' % package_key.urlsafe()
+
+
 class _Platform(object):
   ALL = 'all'
   SANTA = 'santa'
@@ -245,17 +255,20 @@ class BlockableHandler(handler_utils.UserFacingHandler):
       blockable.InsertBigQueryRow(
           constants.BLOCK_ACTION.FIRST_SEEN, timestamp=timestamp)
 
-      # If one was provided, create a note to accompany the blockable.
+      # If one was provided, create a note to accompany the blockable. The
+      # Note key is fully determined up front, so both entities can go out in
+      # a single batched put.
+      to_put = [blockable]
       note_text = self.request.get('notes')
       if note_text:
         note_key = note_models.Note.GenerateKey(note_text, blockable.key)
         note = note_models.Note(
             key=note_key, message=note_text, author=self.user.key.id())
-        note.put()
+        to_put.append(note)
 
-        blockable.notes.append(note.key)
+        blockable.notes.append(note_key)
 
-      blockable.put()
+      ndb.put_multi(to_put)
       self.respond_json(blockable)
 
   @handler_utils.RequirePermission(constants.PERMISSIONS.RESET_BLOCKABLE_STATE)
@@ -292,15 +305,28 @@ class PackageContentsHandler(handler_utils.UserFacingHandler):
           httplib.BAD_REQUEST,
           explanation='Only SantaBundles currently supported')
 
-    # Order by the rel_path first, and then by the file_name which should
-    # effectively sort by the full relative path in the bundle.
-    query = package_models.SantaBundleBinary.query(
-        ancestor=blockable.key).order(
-            package_models.SantaBundleBinary.rel_path,
-            package_models.SantaBundleBinary.file_name)
+    # Check Memcache first.
+    memcache_key = _CreateContentsMemcacheKey(blockable.key)
+    binary_dicts = memcache.get(memcache_key)
+
+    if binary_dicts is None:
+
+      # Order by the rel_path first, and then by the file_name which should
+      # effectively sort by the full relative path in the bundle.
+      query = package_models.SantaBundleBinary.query(
+          ancestor=blockable.key).order(
+              package_models.SantaBundleBinary.rel_path,
+              package_models.SantaBundleBinary.file_name)
+
+      binary_dicts = [binary.to_dict() for binary in query.fetch()]
+
+      # Only cache bundles that have finished uploading, as their contents can
+      # still grow until then.
+      if blockable.has_been_uploaded:
+        memcache.set(
+            memcache_key, binary_dicts, time=_CONTENTS_MEMCACHE_TIMEOUT)
 
-    binaries = query.fetch()
-    self.respond_json(binaries)
+    self.respond_json(binary_dicts)
 
 
 class PendingStateChangeHandler(handler_utils.UserFacingHandler):
@@ -141,9 +141,11 @@ class VoteCastHandler(handler_utils.UserFacingHandler):
       self.abort(httplib.INTERNAL_SERVER_ERROR, explanation=e.message)
     else:
 
-      # Update the user's last vote date
+      # Update the user's last vote date. The write is independent of the
+      # response assembly below, so let it run in the background and only
+      # block on it right before responding.
       self.user.last_vote_dt = datetime.datetime.utcnow()
-      self.user.put()
+      user_put_future = self.user.put_async()
 
       # Augment the response dict with related voting data.
       blockable = binary_models.Blockable.get_by_id(blockable_id)
@@ -152,6 +154,7 @@ class VoteCastHandler(handler_utils.UserFacingHandler):
       blockable_dict['is_voting_allowed'] = allowed
       blockable_dict['voting_prohibited_reason'] = reason
 
+      user_put_future.get_result()
       self.respond_json({'blockable': blockable_dict, 'vote': vote})
 
   def get(self, blockable_id):
@@ -16,6 +16,8 @@
 
 import logging
 
+from google.appengine.ext import ndb
+
 from upvote.gae.datastore.models import cache
 
 
@@ -35,6 +37,20 @@ class BigRedButton(object):
   def get_switch_value(self, switch):
     return cache.KeyValueCache.get_or_insert(switch, value=False).value
 
+  def get_all_switch_values(self):
+    """Batch-reads every switch with a single Datastore round-trip.
+
+    Returns:
+      A dict mapping each switch name to its boolean value. Switches that
+      have never been written read as False, matching get_switch_value().
+    """
+    keys = [
+        ndb.Key(cache.KeyValueCache, switch) for switch in self.ALL_SWITCHES]
+    entities = ndb.get_multi(keys)
+    return {
+        switch: bool(entity and entity.value)
+        for switch, entity in zip(self.ALL_SWITCHES, entities)}
+
   def set_switch_value(self, switch, value):
     switch_cache = cache.KeyValueCache.get_or_insert(switch)
     switch_cache.value = value
@@ -42,23 +58,29 @@ class BigRedButton(object):
 
   @property
   def stop_stop_stop(self):
-    return (self.get_switch_value(self.BIG_RED_BUTTON) and
-            self.get_switch_value(self.BIG_RED_BUTTON_STOP1) and
-            self.get_switch_value(self.BIG_RED_BUTTON_STOP2))
+    values = self.get_all_switch_values()
+    return (values[self.BIG_RED_BUTTON] and
+            values[self.BIG_RED_BUTTON_STOP1] and
+            values[self.BIG_RED_BUTTON_STOP2])
 
   @property
   def go_go_go(self):
-    return (self.get_switch_value(self.BIG_RED_BUTTON) and
-            self.get_switch_value(self.BIG_RED_BUTTON_GO1) and
-            self.get_switch_value(self.BIG_RED_BUTTON_GO2))
+    values = self.get_all_switch_values()
+    return (values[self.BIG_RED_BUTTON] and
+            values[self.BIG_RED_BUTTON_GO1] and
+            values[self.BIG_RED_BUTTON_GO2])
 
   def get_button_status(self):
     """Build and return dict of current state of BRB settings."""
-    response_dict = {}
-    for switch in self.ALL_SWITCHES:
-      response_dict[switch] = self.get_switch_value(switch)
-    response_dict['stop_stop_stop'] = self.stop_stop_stop
-    response_dict['go_go_go'] = self.go_go_go
+    response_dict = self.get_all_switch_values()
+    response_dict['stop_stop_stop'] = (
+        response_dict[self.BIG_RED_BUTTON] and
+        response_dict[self.BIG_RED_BUTTON_STOP1] and
+        response_dict[self.BIG_RED_BUTTON_STOP2])
+    response_dict['go_go_go'] = (
+        response_dict[self.BIG_RED_BUTTON] and
+        response_dict[self.BIG_RED_BUTTON_GO1] and
+        response_dict[self.BIG_RED_BUTTON_GO2])
     return response_dict
 
   def turn_everything_off(self):
@@ -21,12 +21,16 @@ from __future__ import print_function
 import re
 
 
+# Compiled once rather than re-parsed per conversion.
+_UPPERCASE_CHAR_RE = re.compile(r'([A-Z])')
+
+
 def CamelToSnakeCase(input_string):
   """Converts camelCase to snake_case."""
 
   # Prepend every uppercase character with an underscore
   # e.g. camelCase -> camel_Case
-  with_underscores = re.sub(r'([A-Z])', r'_\1', input_string)
+  with_underscores = _UPPERCASE_CHAR_RE.sub(r'_\1', input_string)
 
   # Ensure a name starting with an uppercase letter does not have an underscore
   # e.g. CamelCase -> _Camel_Case -> Camel_Case